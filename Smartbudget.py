@@ -16,9 +16,19 @@ from matplotlib.figure import Figure
 import numpy as np
 from datetime import datetime, timedelta
 import re
+import sys
 from collections import defaultdict
 import os
 import locale
+import argparse
+import hashlib
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
 
 # Configurar locale para formato brasileiro
 try:
@@ -29,203 +39,17 @@ except:
     except:
         pass
 
-class SmartBudgetApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("SmartBudget - Dashboard Financeiro Inteligente")
-        self.root.geometry("1400x900")
-        self.root.configure(bg='#1a1a1a')
-        self.root.resizable(True, True)
-        
-        # Dados da aplicação
-        self.df = None
-        self.categorias_personalizadas = {}
-        
-        # Configurar estilo
-        self.setup_style()
-        
-        # Criar interface
-        self.create_main_interface()
-        
-        # Dados de exemplo para demonstração
-        self.create_sample_data()
-    
-    def setup_style(self):
-        """Configurar tema escuro moderno"""
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # Cores do tema
-        bg_color = '#1a1a1a'
-        fg_color = '#ffffff'
-        select_bg = '#404040'
-        
-        style.configure('TFrame', background=bg_color)
-        style.configure('TLabel', background=bg_color, foreground=fg_color, font=('Segoe UI', 10))
-        style.configure('Title.TLabel', font=('Segoe UI', 16, 'bold'))
-        style.configure('Header.TLabel', font=('Segoe UI', 12, 'bold'))
-        style.configure('TButton', font=('Segoe UI', 10))
-        
-        # Configurar matplotlib para tema escuro
-        plt.style.use('dark_background')
-    
-    def create_main_interface(self):
-        """Criar interface principal"""
-        # Frame principal
-        main_frame = ttk.Frame(self.root)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Header com título e botão de importação
-        self.create_header(main_frame)
-        
-        # Frame de conteúdo principal
-        content_frame = ttk.Frame(main_frame)
-        content_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
-        
-        # Painel esquerdo - Métricas e Score
-        left_panel = ttk.Frame(content_frame)
-        left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
-        
-        # Painel direito - Gráficos
-        right_panel = ttk.Frame(content_frame)
-        right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
-        
-        # Criar seções
-        self.create_metrics_section(left_panel)
-        self.create_charts_section(right_panel)
-        
-        # Status bar
-        self.create_status_bar(main_frame)
-    
-    def create_header(self, parent):
-        """Criar cabeçalho da aplicação"""
-        header_frame = ttk.Frame(parent)
-        header_frame.pack(fill=tk.X, pady=(0, 20))
-        
-        # Título
-        title_label = ttk.Label(header_frame, text="💰 SmartBudget", style='Title.TLabel')
-        title_label.pack(side=tk.LEFT)
-        
-        # Subtítulo
-        subtitle_label = ttk.Label(header_frame, text="Dashboard Financeiro Inteligente", 
-                                 font=('Segoe UI', 10, 'italic'))
-        subtitle_label.pack(side=tk.LEFT, padx=(10, 0))
-        
-        # Botão de importar
-        import_btn = ttk.Button(header_frame, text="📁 Importar CSV Nubank", 
-                               command=self.import_csv)
-        import_btn.pack(side=tk.RIGHT)
-        
-        # Botão de dados de exemplo
-        sample_btn = ttk.Button(header_frame, text="🎯 Usar Dados Exemplo", 
-                               command=self.load_sample_data)
-        sample_btn.pack(side=tk.RIGHT, padx=(0, 10))
-    
-    def create_metrics_section(self, parent):
-        """Criar seção de métricas e score"""
-        # Score de Saúde Financeira
-        score_frame = tk.Frame(parent, bg='#2d2d2d', relief=tk.RAISED, bd=2)
-        score_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        score_title = tk.Label(score_frame, text="🎯 Score de Saúde Financeira", 
-                              bg='#2d2d2d', fg='white', font=('Segoe UI', 12, 'bold'))
-        score_title.pack(pady=5)
-        
-        self.score_label = tk.Label(score_frame, text="--", 
-                                   bg='#2d2d2d', fg='#00ff00', font=('Segoe UI', 24, 'bold'))
-        self.score_label.pack(pady=5)
-        
-        self.score_desc = tk.Label(score_frame, text="Aguardando dados...", 
-                                  bg='#2d2d2d', fg='#cccccc', font=('Segoe UI', 10))
-        self.score_desc.pack(pady=(0, 10))
-        
-        # Métricas principais
-        metrics_frame = tk.Frame(parent, bg='#2d2d2d', relief=tk.RAISED, bd=2)
-        metrics_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
-        
-        metrics_title = tk.Label(metrics_frame, text="📊 Métricas do Mês", 
-                                bg='#2d2d2d', fg='white', font=('Segoe UI', 12, 'bold'))
-        metrics_title.pack(pady=5)
-        
-        # Frame para métricas
-        self.metrics_content = tk.Frame(metrics_frame, bg='#2d2d2d')
-        self.metrics_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        # Previsões e Alertas
-        predictions_frame = tk.Frame(parent, bg='#2d2d2d', relief=tk.RAISED, bd=2)
-        predictions_frame.pack(fill=tk.X)
-        
-        pred_title = tk.Label(predictions_frame, text="🔮 Previsões e Alertas", 
-                             bg='#2d2d2d', fg='white', font=('Segoe UI', 12, 'bold'))
-        pred_title.pack(pady=5)
-        
-        self.predictions_content = tk.Frame(predictions_frame, bg='#2d2d2d')
-        self.predictions_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-    
-    def create_charts_section(self, parent):
-        """Criar seção de gráficos"""
-        # Notebook para múltiplos gráficos
-        notebook = ttk.Notebook(parent)
-        notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # Aba 1: Evolução Mensal
-        evolution_frame = ttk.Frame(notebook)
-        notebook.add(evolution_frame, text="📈 Evolução Mensal")
-        
-        # Aba 2: Categorias
-        categories_frame = ttk.Frame(notebook)
-        notebook.add(categories_frame, text="🏷️ Por Categoria")
-        
-        # Aba 3: Padrões
-        patterns_frame = ttk.Frame(notebook)
-        notebook.add(patterns_frame, text="🔍 Padrões")
-        
-        # Criar canvas para gráficos
-        self.create_evolution_chart(evolution_frame)
-        self.create_categories_chart(categories_frame)
-        self.create_patterns_chart(patterns_frame)
-    
-    def create_evolution_chart(self, parent):
-        """Criar gráfico de evolução mensal"""
-        fig = Figure(figsize=(8, 6), facecolor='#1a1a1a')
-        self.evolution_ax = fig.add_subplot(111, facecolor='#2d2d2d')
-        
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        self.evolution_canvas = canvas
-    
-    def create_categories_chart(self, parent):
-        """Criar gráfico de categorias"""
-        fig = Figure(figsize=(8, 6), facecolor='#1a1a1a')
-        self.categories_ax = fig.add_subplot(111, facecolor='#2d2d2d')
-        
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        self.categories_canvas = canvas
+class BudgetAnalyzer:
+    """Análises financeiras independentes da interface Tk
     
-    def create_patterns_chart(self, parent):
-        """Criar gráfico de padrões"""
-        fig = Figure(figsize=(8, 6), facecolor='#1a1a1a')
-        self.patterns_ax = fig.add_subplot(111, facecolor='#2d2d2d')
-        
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        self.patterns_canvas = canvas
+    Compartilhada pelo dashboard (SmartBudgetApp) e pelo modo serviço
+    (BudgetQueryService).
+    """
     
-    def create_status_bar(self, parent):
-        """Criar barra de status"""
-        status_frame = ttk.Frame(parent)
-        status_frame.pack(fill=tk.X, pady=(10, 0))
-        
-        self.status_label = ttk.Label(status_frame, text="Pronto para analisar seus dados financeiros")
-        self.status_label.pack(side=tk.LEFT)
-        
-        # Info da versão
-        version_label = ttk.Label(status_frame, text="SmartBudget v1.0")
-        version_label.pack(side=tk.RIGHT)
+    def __init__(self):
+        self.df = None
+        # Incrementado a cada novo conjunto de dados processado
+        self.data_version = 0
     
     def create_sample_data(self):
         """Criar dados de exemplo para demonstração"""
@@ -283,49 +107,23 @@ class SmartBudgetApp:
             'Descrição': descriptions
         })
     
-    def load_sample_data(self):
-        """Carregar dados de exemplo"""
-        self.df = self.sample_df.copy()
-        self.process_data()
-        self.status_label.config(text="Dados de exemplo carregados com sucesso!")
-    
-    def import_csv(self):
-        """Importar arquivo CSV do Nubank"""
-        file_path = filedialog.askopenfilename(
-            title="Selecione o arquivo CSV do Nubank",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
-        )
-        
-        if not file_path:
-            return
-        
-        try:
-            # Tentar diferentes encodings
-            encodings = ['utf-8', 'latin-1', 'cp1252']
-            df = None
-            
-            for encoding in encodings:
-                try:
-                    df = pd.read_csv(file_path, encoding=encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if df is None:
-                raise Exception("Não foi possível ler o arquivo com nenhuma codificação")
-            
-            # Detectar formato do Nubank
-            df = self.detect_nubank_format(df)
-            
-            if df is not None:
-                self.df = df
-                self.process_data()
-                self.status_label.config(text=f"Arquivo importado: {len(df)} transações processadas")
-            else:
-                messagebox.showerror("Erro", "Formato do arquivo não reconhecido como CSV do Nubank")
-                
-        except Exception as e:
-            messagebox.showerror("Erro ao importar", f"Erro: {str(e)}")
+    def read_nubank_csv(self, file_path):
+        """Ler CSV do Nubank tentando diferentes encodings"""
+        encodings = ['utf-8', 'latin-1', 'cp1252']
+        df = None
+        
+        for encoding in encodings:
+            try:
+                df = pd.read_csv(file_path, encoding=encoding)
+                break
+            except UnicodeDecodeError:
+                continue
+        
+        if df is None:
+            raise Exception("Não foi possível ler o arquivo com nenhuma codificação")
+        
+        # Detectar formato do Nubank
+        return self.detect_nubank_format(df)
     
     def detect_nubank_format(self, df):
         """Detectar e padronizar formato do CSV do Nubank"""
@@ -468,35 +266,360 @@ class SmartBudgetApp:
         
         return abs(prediction)
     
-    def process_data(self):
-        """Processar dados e atualizar interface"""
-        if self.df is None:
-            return
-        
-        # Adicionar categorias
+    def prepare_data(self):
+        """Normalizar datas, categorizar transações e avançar a versão dos dados"""
+        # Datas em texto (ex.: dados de exemplo) viram datetime; inválidas são descartadas
+        self.df['Data'] = pd.to_datetime(self.df['Data'], errors='coerce')
+        self.df = self.df.dropna(subset=['Data']).reset_index(drop=True)
         self.df['Categoria'] = self.df.apply(lambda x: self.categorize_transaction(x['Descrição']), axis=1)
-        
-        # Atualizar métricas
-        self.update_metrics()
-        
-        # Atualizar gráficos
-        self.update_charts()
+        self.data_version += 1
     
-    def update_metrics(self):
-        """Atualizar métricas na interface"""
-        # Limpar conteúdo anterior
-        for widget in self.metrics_content.winfo_children():
-            widget.destroy()
-        for widget in self.predictions_content.winfo_children():
-            widget.destroy()
+    def category_totals(self):
+        """Gastos totais por categoria (valores absolutos, decrescente)"""
+        return self.df[self.df['Valor'] < 0].groupby('Categoria')['Valor'].sum().abs().sort_values(ascending=False)
+    
+    def monthly_balance(self):
+        """Saldo mensal (receitas - despesas) indexado por período"""
+        return self.df.groupby(self.df['Data'].dt.to_period('M'))['Valor'].agg(
+            lambda x: x[x > 0].sum() - abs(x[x < 0].sum())
+        )
+    
+    def weekday_pattern(self):
+        """Gastos por dia da semana, de segunda a domingo"""
+        days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+        days_pt = ['Segunda', 'Terça', 'Quarta', 'Quinta', 'Sexta', 'Sábado', 'Domingo']
         
-        if self.df is None:
-            return
+        expenses = self.df[self.df['Valor'] < 0]
+        weekday_spending = expenses.groupby(expenses['Data'].dt.day_name())['Valor'].sum().abs()
         
-        # Calcular score
-        score, score_desc = self.calculate_financial_score()
-        self.score_label.config(text=f"{score}")
-        self.score_desc.config(text=score_desc)
+        return {day_pt: float(weekday_spending.get(day, 0)) for day, day_pt in zip(days_order, days_pt)}
+
+
+class SmartBudgetApp(BudgetAnalyzer):
+    def __init__(self, root):
+        self.root = root
+        self.root.title("SmartBudget - Dashboard Financeiro Inteligente")
+        self.root.geometry("1400x900")
+        self.root.configure(bg='#1a1a1a')
+        self.root.resizable(True, True)
+        
+        # Dados da aplicação
+        super().__init__()
+        self.categorias_personalizadas = {}
+        
+        # Controle de atualização agrupada (debounce)
+        self.refresh_delay_ms = 120
+        self._refresh_job = None
+        self._pending_refreshes = 0
+        self.skipped_renders = 0
+        
+        # Configurar estilo
+        self.setup_style()
+        
+        # Criar interface
+        self.create_main_interface()
+        
+        # Dados de exemplo para demonstração
+        self.create_sample_data()
+    
+    def setup_style(self):
+        """Configurar tema escuro moderno"""
+        style = ttk.Style()
+        style.theme_use('clam')
+        
+        # Cores do tema
+        bg_color = '#1a1a1a'
+        fg_color = '#ffffff'
+        select_bg = '#404040'
+        
+        style.configure('TFrame', background=bg_color)
+        style.configure('TLabel', background=bg_color, foreground=fg_color, font=('Segoe UI', 10))
+        style.configure('Title.TLabel', font=('Segoe UI', 16, 'bold'))
+        style.configure('Header.TLabel', font=('Segoe UI', 12, 'bold'))
+        style.configure('TButton', font=('Segoe UI', 10))
+        
+        # Configurar matplotlib para tema escuro
+        plt.style.use('dark_background')
+    
+    def create_main_interface(self):
+        """Criar interface principal"""
+        # Frame principal
+        main_frame = ttk.Frame(self.root)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Header com título e botão de importação
+        self.create_header(main_frame)
+        
+        # Frame de conteúdo principal
+        content_frame = ttk.Frame(main_frame)
+        content_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        
+        # Painel esquerdo - Métricas e Score
+        left_panel = ttk.Frame(content_frame)
+        left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
+        
+        # Painel direito - Gráficos
+        right_panel = ttk.Frame(content_frame)
+        right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
+        
+        # Criar seções
+        self.create_metrics_section(left_panel)
+        self.create_charts_section(right_panel)
+        
+        # Status bar
+        self.create_status_bar(main_frame)
+    
+    def create_header(self, parent):
+        """Criar cabeçalho da aplicação"""
+        header_frame = ttk.Frame(parent)
+        header_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        # Título
+        title_label = ttk.Label(header_frame, text="💰 SmartBudget", style='Title.TLabel')
+        title_label.pack(side=tk.LEFT)
+        
+        # Subtítulo
+        subtitle_label = ttk.Label(header_frame, text="Dashboard Financeiro Inteligente", 
+                                 font=('Segoe UI', 10, 'italic'))
+        subtitle_label.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Botão de importar
+        import_btn = ttk.Button(header_frame, text="📁 Importar CSV Nubank", 
+                               command=self.import_csv)
+        import_btn.pack(side=tk.RIGHT)
+        
+        # Botão de dados de exemplo
+        sample_btn = ttk.Button(header_frame, text="🎯 Usar Dados Exemplo", 
+                               command=self.load_sample_data)
+        sample_btn.pack(side=tk.RIGHT, padx=(0, 10))
+    
+    def create_metrics_section(self, parent):
+        """Criar seção de métricas e score"""
+        # Score de Saúde Financeira
+        score_frame = tk.Frame(parent, bg='#2d2d2d', relief=tk.RAISED, bd=2)
+        score_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        score_title = tk.Label(score_frame, text="🎯 Score de Saúde Financeira", 
+                              bg='#2d2d2d', fg='white', font=('Segoe UI', 12, 'bold'))
+        score_title.pack(pady=5)
+        
+        self.score_label = tk.Label(score_frame, text="--", 
+                                   bg='#2d2d2d', fg='#00ff00', font=('Segoe UI', 24, 'bold'))
+        self.score_label.pack(pady=5)
+        
+        self.score_desc = tk.Label(score_frame, text="Aguardando dados...", 
+                                  bg='#2d2d2d', fg='#cccccc', font=('Segoe UI', 10))
+        self.score_desc.pack(pady=(0, 10))
+        
+        # Métricas principais
+        metrics_frame = tk.Frame(parent, bg='#2d2d2d', relief=tk.RAISED, bd=2)
+        metrics_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        
+        metrics_title = tk.Label(metrics_frame, text="📊 Métricas do Mês", 
+                                bg='#2d2d2d', fg='white', font=('Segoe UI', 12, 'bold'))
+        metrics_title.pack(pady=5)
+        
+        # Frame para métricas
+        self.metrics_content = tk.Frame(metrics_frame, bg='#2d2d2d')
+        self.metrics_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        # Cartões de métricas criados uma única vez; update_metrics só altera texto e cor
+        self.metric_labels = {}
+        metrics = [
+            ('receitas', "💰 Receitas"),
+            ('despesas', "💸 Despesas"),
+            ('saldo', "💳 Saldo"),
+            ('transacoes', "📊 Transações")
+        ]
+        
+        for i, (key, label) in enumerate(metrics):
+            row = i // 2
+            col = i % 2
+            
+            metric_frame = tk.Frame(self.metrics_content, bg='#404040', relief=tk.RAISED, bd=1)
+            metric_frame.grid(row=row, column=col, padx=5, pady=5, sticky='ew')
+            
+            tk.Label(metric_frame, text=label, bg='#404040', fg='white', 
+                    font=('Segoe UI', 9)).pack(pady=2)
+            value_label = tk.Label(metric_frame, text="--", bg='#404040', fg='#888888', 
+                                   font=('Segoe UI', 12, 'bold'))
+            value_label.pack(pady=2)
+            self.metric_labels[key] = value_label
+        
+        self.metrics_content.grid_columnconfigure(0, weight=1)
+        self.metrics_content.grid_columnconfigure(1, weight=1)
+        
+        # Previsões e Alertas
+        predictions_frame = tk.Frame(parent, bg='#2d2d2d', relief=tk.RAISED, bd=2)
+        predictions_frame.pack(fill=tk.X)
+        
+        pred_title = tk.Label(predictions_frame, text="🔮 Previsões e Alertas", 
+                             bg='#2d2d2d', fg='white', font=('Segoe UI', 12, 'bold'))
+        pred_title.pack(pady=5)
+        
+        self.predictions_content = tk.Frame(predictions_frame, bg='#2d2d2d')
+        self.predictions_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        self.pred_label = tk.Label(self.predictions_content, text="", 
+                                   bg='#2d2d2d', fg='#ffaa00', font=('Segoe UI', 10, 'bold'))
+        self.pred_label.pack(pady=5)
+        
+        self.top_label = tk.Label(self.predictions_content, text="", 
+                                  bg='#2d2d2d', fg='#cccccc', font=('Segoe UI', 9))
+        self.top_label.pack(pady=5)
+    
+    def create_charts_section(self, parent):
+        """Criar seção de gráficos"""
+        # Notebook para múltiplos gráficos
+        notebook = ttk.Notebook(parent)
+        notebook.pack(fill=tk.BOTH, expand=True)
+        
+        # Aba 1: Evolução Mensal
+        evolution_frame = ttk.Frame(notebook)
+        notebook.add(evolution_frame, text="📈 Evolução Mensal")
+        
+        # Aba 2: Categorias
+        categories_frame = ttk.Frame(notebook)
+        notebook.add(categories_frame, text="🏷️ Por Categoria")
+        
+        # Aba 3: Padrões
+        patterns_frame = ttk.Frame(notebook)
+        notebook.add(patterns_frame, text="🔍 Padrões")
+        
+        # Criar canvas para gráficos
+        self.create_evolution_chart(evolution_frame)
+        self.create_categories_chart(categories_frame)
+        self.create_patterns_chart(patterns_frame)
+    
+    def create_evolution_chart(self, parent):
+        """Criar gráfico de evolução mensal"""
+        fig = Figure(figsize=(8, 6), facecolor='#1a1a1a')
+        self.evolution_ax = fig.add_subplot(111, facecolor='#2d2d2d')
+        
+        canvas = FigureCanvasTkAgg(fig, parent)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        self.evolution_canvas = canvas
+    
+    def create_categories_chart(self, parent):
+        """Criar gráfico de categorias"""
+        fig = Figure(figsize=(8, 6), facecolor='#1a1a1a')
+        self.categories_ax = fig.add_subplot(111, facecolor='#2d2d2d')
+        
+        canvas = FigureCanvasTkAgg(fig, parent)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        self.categories_canvas = canvas
+    
+    def create_patterns_chart(self, parent):
+        """Criar gráfico de padrões"""
+        fig = Figure(figsize=(8, 6), facecolor='#1a1a1a')
+        self.patterns_ax = fig.add_subplot(111, facecolor='#2d2d2d')
+        
+        canvas = FigureCanvasTkAgg(fig, parent)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        self.patterns_canvas = canvas
+    
+    def create_status_bar(self, parent):
+        """Criar barra de status"""
+        status_frame = ttk.Frame(parent)
+        status_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        self.status_label = ttk.Label(status_frame, text="Pronto para analisar seus dados financeiros")
+        self.status_label.pack(side=tk.LEFT)
+        
+        # Info da versão
+        version_label = ttk.Label(status_frame, text="SmartBudget v1.0")
+        version_label.pack(side=tk.RIGHT)
+        
+        # Contador de renderizações agrupadas pelo debounce
+        self.refresh_label = ttk.Label(status_frame, text="")
+        self.refresh_label.pack(side=tk.RIGHT, padx=(0, 20))
+    
+    def load_sample_data(self):
+        """Carregar dados de exemplo"""
+        self.df = self.sample_df.copy()
+        self.process_data()
+        self.status_label.config(text="Dados de exemplo carregados com sucesso!")
+    
+    def import_csv(self):
+        """Importar arquivo CSV do Nubank"""
+        file_path = filedialog.askopenfilename(
+            title="Selecione o arquivo CSV do Nubank",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        
+        if not file_path:
+            return
+        
+        try:
+            df = self.read_nubank_csv(file_path)
+            
+            if df is not None:
+                self.df = df
+                self.process_data()
+                self.status_label.config(text=f"Arquivo importado: {len(df)} transações processadas")
+            else:
+                messagebox.showerror("Erro", "Formato do arquivo não reconhecido como CSV do Nubank")
+                
+        except Exception as e:
+            messagebox.showerror("Erro ao importar", f"Erro: {str(e)}")
+    
+    def process_data(self):
+        """Processar dados e atualizar interface"""
+        if self.df is None:
+            return
+        
+        # Adicionar categorias
+        self.prepare_data()
+        
+        # Agendar atualização da interface (agrupa chamadas em sequência)
+        self.schedule_refresh()
+    
+    def schedule_refresh(self):
+        """Agendar renderização com debounce via after()
+        
+        Pedidos feitos antes da renderização pendente executar são agrupados
+        em uma única passada de métricas e gráficos.
+        """
+        if self._refresh_job is not None:
+            self.root.after_cancel(self._refresh_job)
+        
+        self._pending_refreshes += 1
+        self._refresh_job = self.root.after(self.refresh_delay_ms, self._run_refresh)
+    
+    def _run_refresh(self):
+        """Executar a renderização agendada"""
+        self._refresh_job = None
+        skipped = self._pending_refreshes - 1
+        self._pending_refreshes = 0
+        
+        try:
+            # Atualizar métricas
+            self.update_metrics()
+            
+            # Atualizar gráficos
+            self.update_charts()
+        except Exception as e:
+            messagebox.showerror("Erro ao atualizar", f"Erro: {str(e)}")
+            self.status_label.config(text="Erro ao processar os dados")
+        
+        if skipped > 0:
+            self.skipped_renders += skipped
+            self.refresh_label.config(
+                text=f"{skipped} atualizações agrupadas ({self.skipped_renders} no total)"
+            )
+    
+    def update_metrics(self):
+        """Atualizar métricas na interface"""
+        if self.df is None:
+            return
+        
+        # Calcular score
+        score, score_desc = self.calculate_financial_score()
+        self.score_label.config(text=f"{score}")
+        self.score_desc.config(text=score_desc)
         
         # Cor do score
         if score >= 80:
@@ -518,47 +641,34 @@ class SmartBudgetApp:
             saldo = receitas - despesas
             
             # Exibir métricas
-            metrics = [
-                ("💰 Receitas", f"R$ {receitas:,.2f}", '#00ff00'),
-                ("💸 Despesas", f"R$ {despesas:,.2f}", '#ff4444'),
-                ("💳 Saldo", f"R$ {saldo:,.2f}", '#00ff00' if saldo >= 0 else '#ff4444'),
-                ("📊 Transações", f"{len(current_month)}", '#888888')
-            ]
-            
-            for i, (label, value, color) in enumerate(metrics):
-                row = i // 2
-                col = i % 2
-                
-                metric_frame = tk.Frame(self.metrics_content, bg='#404040', relief=tk.RAISED, bd=1)
-                metric_frame.grid(row=row, column=col, padx=5, pady=5, sticky='ew')
-                
-                tk.Label(metric_frame, text=label, bg='#404040', fg='white', 
-                        font=('Segoe UI', 9)).pack(pady=2)
-                tk.Label(metric_frame, text=value, bg='#404040', fg=color, 
-                        font=('Segoe UI', 12, 'bold')).pack(pady=2)
+            metrics = {
+                'receitas': (f"R$ {receitas:,.2f}", '#00ff00'),
+                'despesas': (f"R$ {despesas:,.2f}", '#ff4444'),
+                'saldo': (f"R$ {saldo:,.2f}", '#00ff00' if saldo >= 0 else '#ff4444'),
+                'transacoes': (f"{len(current_month)}", '#888888')
+            }
+        else:
+            metrics = {key: ("--", '#888888') for key in self.metric_labels}
         
-        self.metrics_content.grid_columnconfigure(0, weight=1)
-        self.metrics_content.grid_columnconfigure(1, weight=1)
+        for key, (value, color) in metrics.items():
+            self.metric_labels[key].config(text=value, fg=color)
         
         # Previsões
         prediction = self.predict_next_month()
         
         # Top 3 categorias que mais gastam
-        category_spending = self.df[self.df['Valor'] < 0].groupby('Categoria')['Valor'].sum().abs().sort_values(ascending=False)
+        category_spending = self.category_totals()
         
         predictions_text = f"🔮 Previsão próximo mês: R$ {prediction:,.2f}"
-        pred_label = tk.Label(self.predictions_content, text=predictions_text, 
-                             bg='#2d2d2d', fg='#ffaa00', font=('Segoe UI', 10, 'bold'))
-        pred_label.pack(pady=5)
+        self.pred_label.config(text=predictions_text)
         
+        top_text = ""
         if len(category_spending) > 0:
             top_text = "🏆 Maiores gastos:\n"
             for i, (cat, value) in enumerate(category_spending.head(3).items()):
                 top_text += f"{i+1}. {cat}: R$ {value:,.2f}\n"
-            
-            top_label = tk.Label(self.predictions_content, text=top_text, 
-                               bg='#2d2d2d', fg='#cccccc', font=('Segoe UI', 9))
-            top_label.pack(pady=5)
+        
+        self.top_label.config(text=top_text)
     
     def update_charts(self):
         """Atualizar todos os gráficos"""
@@ -574,13 +684,11 @@ class SmartBudgetApp:
         self.evolution_ax.clear()
         
         # Agrupar por mês
-        monthly_data = self.df.groupby(self.df['Data'].dt.to_period('M')).agg({
-            'Valor': lambda x: x[x > 0].sum() - abs(x[x < 0].sum())  # Saldo mensal
-        })
+        monthly_data = self.monthly_balance()
         
         if len(monthly_data) > 0:
             months = [str(period) for period in monthly_data.index]
-            values = monthly_data['Valor'].values
+            values = monthly_data.values
             
             colors = ['#00ff00' if v >= 0 else '#ff4444' for v in values]
             
@@ -608,7 +716,7 @@ class SmartBudgetApp:
         self.categories_ax.clear()
         
         # Gastos por categoria (apenas valores negativos)
-        category_data = self.df[self.df['Valor'] < 0].groupby('Categoria')['Valor'].sum().abs().sort_values(ascending=False)
+        category_data = self.category_totals()
         
         if len(category_data) > 0:
             # Cores vibrantes para cada categoria
@@ -638,25 +746,11 @@ class SmartBudgetApp:
         self.patterns_ax.clear()
         
         # Gastos por dia da semana
-        self.df['DiaSemana'] = self.df['Data'].dt.day_name()
-        weekday_spending = self.df[self.df['Valor'] < 0].groupby('DiaSemana')['Valor'].sum().abs()
+        weekday_spending = self.weekday_pattern()
         
-        # Ordenar dias da semana
-        days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        days_pt = ['Segunda', 'Terça', 'Quarta', 'Quinta', 'Sexta', 'Sábado', 'Domingo']
-        
-        if len(weekday_spending) > 0:
-            # Reordenar dados
-            ordered_data = []
-            ordered_labels = []
-            
-            for i, day in enumerate(days_order):
-                if day in weekday_spending.index:
-                    ordered_data.append(weekday_spending[day])
-                    ordered_labels.append(days_pt[i])
-                else:
-                    ordered_data.append(0)
-                    ordered_labels.append(days_pt[i])
+        if sum(weekday_spending.values()) > 0:
+            ordered_labels = list(weekday_spending.keys())
+            ordered_data = list(weekday_spending.values())
             
             colors = ['#ff6b6b', '#4ecdc4', '#45b7d1', '#f9ca24', '#f0932b', '#eb4d4b', '#6c5ce7']
             
@@ -673,8 +767,327 @@ class SmartBudgetApp:
         self.patterns_canvas.draw()
 
 
+class BudgetQueryService(BudgetAnalyzer):
+    """Serviço de consultas JSON sobre as análises, sem janela Tk
+    
+    As respostas são memorizadas por versão dos dados e data da análise
+    (score e previsão usam janelas contadas a partir de hoje). Quando o CSV
+    de origem muda no disco, os dados são recarregados; se a releitura
+    falhar, continua servindo a última versão válida.
+    """
+    
+    def __init__(self, csv_path=None):
+        super().__init__()
+        self.csv_path = csv_path
+        self._csv_mtime = None
+        self._reload_error = None
+        self._cache = {}
+        self._cache_stamp = None
+        # Protege releitura do CSV e cálculo; acertos no cache não passam por ele
+        self._lock = threading.Lock()
+        
+        self.endpoints = {
+            '/score': self.query_score,
+            '/forecast': self.query_forecast,
+            '/categories': self.query_categories,
+            '/monthly': self.query_monthly,
+            '/weekdays': self.query_weekdays
+        }
+        
+        self.load_data()
+    
+    def load_data(self):
+        """Carregar CSV informado ou, na ausência dele, dados de exemplo"""
+        if self.csv_path:
+            df = self.read_nubank_csv(self.csv_path)
+            if df is None:
+                raise Exception("Formato do arquivo não reconhecido como CSV do Nubank")
+            self._csv_mtime = os.path.getmtime(self.csv_path)
+        else:
+            self.create_sample_data()
+            df = self.sample_df.copy()
+        
+        # Preservar os dados anteriores caso o processamento falhe
+        previous_df = self.df
+        self.df = df
+        try:
+            self.prepare_data()
+        except Exception:
+            self.df = previous_df
+            raise
+    
+    def refresh_if_changed(self):
+        """Recarregar os dados se o CSV foi alterado desde a última leitura"""
+        if not self.csv_path:
+            return
+        
+        try:
+            mtime = os.path.getmtime(self.csv_path)
+        except OSError as e:
+            self.log_reload_error(e)
+            return
+        
+        if mtime == self._csv_mtime:
+            return
+        
+        with self._lock:
+            if mtime == self._csv_mtime:
+                return
+            
+            try:
+                self.load_data()
+                self._reload_error = None
+            except Exception as e:
+                # Não tentar de novo o mesmo arquivo (ex.: gravação pela metade)
+                self._csv_mtime = mtime
+                self.log_reload_error(e)
+    
+    def log_reload_error(self, error):
+        """Registrar falha de releitura uma única vez por erro distinto"""
+        message = str(error)
+        if message != self._reload_error:
+            self._reload_error = message
+            print(f"Falha ao recarregar {self.csv_path}: {message} "
+                  f"(mantendo versão {self.data_version} dos dados)", file=sys.stderr)
+    
+    def query_score(self):
+        score, desc = self.calculate_financial_score()
+        return {'score': score, 'descricao': desc}
+    
+    def query_forecast(self):
+        return {'previsao_proximo_mes': round(float(self.predict_next_month()), 2)}
+    
+    def query_categories(self):
+        return {cat: round(float(value), 2) for cat, value in self.category_totals().items()}
+    
+    def query_monthly(self):
+        return {str(period): round(float(value), 2) for period, value in self.monthly_balance().items()}
+    
+    def query_weekdays(self):
+        return {day: round(value, 2) for day, value in self.weekday_pattern().items()}
+    
+    def get(self, path):
+        """Retornar (corpo JSON, ETag) para o endpoint, ou None se não existir"""
+        if path not in self.endpoints:
+            return None
+        
+        self.refresh_if_changed()
+        
+        cached = self._cache.get((self.data_version, datetime.now().date(), path))
+        if cached is not None:
+            return cached
+        
+        with self._lock:
+            stamp = (self.data_version, datetime.now().date())
+            if stamp != self._cache_stamp:
+                # Nova versão dos dados ou novo dia: descartar respostas antigas
+                self._cache = {}
+                self._cache_stamp = stamp
+            
+            key = stamp + (path,)
+            if key not in self._cache:
+                # ETag é o hash do conteúdo: dados iguais após releitura mantêm o ETag
+                body = json.dumps(self.endpoints[path](), ensure_ascii=False).encode('utf-8')
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()
+                self._cache[key] = (body, etag)
+            
+            return self._cache[key]
+
+
+class BudgetRequestHandler(BaseHTTPRequestHandler):
+    """Handler HTTP dos endpoints do BudgetQueryService"""
+    
+    server_version = "SmartBudget/1.0"
+    
+    def do_GET(self):
+        path = self.path.split('?', 1)[0].rstrip('/') or '/'
+        
+        if path == '/':
+            body = json.dumps({'endpoints': sorted(self.server.service.endpoints)}).encode('utf-8')
+            self.send_json(200, body)
+            return
+        
+        try:
+            result = self.server.service.get(path)
+        except Exception as e:
+            body = json.dumps({'erro': str(e)}, ensure_ascii=False).encode('utf-8')
+            self.send_json(500, body)
+            return
+        
+        if result is None:
+            self.send_json(404, json.dumps({'erro': 'Endpoint não encontrado'}, ensure_ascii=False).encode('utf-8'))
+            return
+        
+        body, etag = result
+        
+        if self.etag_matches(etag):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        
+        self.send_json(200, body, etag)
+    
+    def etag_matches(self, etag):
+        """Comparar o ETag com os tokens de If-None-Match (aceita W/ e *)"""
+        header = self.headers.get('If-None-Match')
+        if not header:
+            return False
+        
+        for token in header.split(','):
+            token = token.strip()
+            if token.startswith('W/'):
+                token = token[2:]
+            if token == '*' or token == etag:
+                return True
+        
+        return False
+    
+    def send_json(self, status, body, etag=None):
+        """Enviar resposta JSON com cabeçalhos de cache"""
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        # Silenciar log por requisição (ruído durante testes de carga)
+        pass
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer que atende conexões em um pool fixo de threads"""
+    
+    def __init__(self, server_address, service, workers=8):
+        super().__init__(server_address, BudgetRequestHandler)
+        self.service = service
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='smartbudget')
+    
+    def process_request(self, request, client_address):
+        self.pool.submit(self.process_request_thread, request, client_address)
+    
+    def process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+    
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=False)
+
+
+def run_load_test(base_url, total_requests=2000, concurrency=16):
+    """Disparar requisições concorrentes contra o serviço e medir requisições/s
+    
+    Metade das requisições reenvia o ETag recebido e deve receber 304; a
+    outra metade deve receber 200. Falhas de transporte contam como 'erro'.
+    """
+    paths = ['/score', '/forecast', '/categories', '/monthly', '/weekdays']
+    etags = {}
+    
+    # Aquecer o cache e coletar os ETags
+    for path in paths:
+        with urllib.request.urlopen(base_url + path) as response:
+            response.read()
+            etags[path] = response.headers['ETag']
+    
+    def fetch(i):
+        path = paths[i % len(paths)]
+        conditional = bool(i % 2)
+        request = urllib.request.Request(base_url + path)
+        if conditional:
+            request.add_header('If-None-Match', etags[path])
+        
+        try:
+            with urllib.request.urlopen(request) as response:
+                response.read()
+                return conditional, str(response.status)
+        except urllib.error.HTTPError as e:
+            return conditional, str(e.code)
+        except (urllib.error.URLError, OSError):
+            return conditional, 'erro'
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(fetch, range(total_requests)))
+    elapsed = time.perf_counter() - start
+    
+    statuses = [status for _, status in results]
+    failures = sum(1 for conditional, status in results
+                   if status != ('304' if conditional else '200'))
+    
+    return {
+        'requisicoes': total_requests,
+        'concorrencia': concurrency,
+        'segundos': round(elapsed, 3),
+        'req_por_segundo': round(total_requests / elapsed, 1),
+        'status': {status: statuses.count(status) for status in sorted(set(statuses))},
+        'falhas': failures
+    }
+
+
+def serve(csv_path=None, host='127.0.0.1', port=8765, workers=8):
+    """Iniciar o modo serviço (API JSON local)"""
+    service = BudgetQueryService(csv_path)
+    server = PooledHTTPServer((host, port), service, workers)
+    
+    print(f"SmartBudget servindo em http://{host}:{server.server_port}/ ({workers} threads)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def load_test(csv_path=None, workers=8, total_requests=2000, concurrency=16):
+    """Subir uma instância local em porta livre e executar o teste de carga"""
+    service = BudgetQueryService(csv_path)
+    server = PooledHTTPServer(('127.0.0.1', 0), service, workers)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    
+    try:
+        result = run_load_test(f"http://127.0.0.1:{server.server_port}", total_requests, concurrency)
+    finally:
+        server.shutdown()
+        server.server_close()
+    
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    return result['falhas'] == 0
+
+
 def main():
     """Função principal"""
+    parser = argparse.ArgumentParser(description="SmartBudget - Dashboard Financeiro Inteligente")
+    parser.add_argument('--serve', action='store_true', help="servir as análises via API JSON local, sem interface")
+    parser.add_argument('--load-test', action='store_true', help="medir requisições/s contra uma instância local")
+    parser.add_argument('--csv', help="CSV do Nubank usado no modo serviço (padrão: dados de exemplo)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=8, help="threads do pool de atendimento")
+    parser.add_argument('--requests', type=int, default=2000, help="total de requisições no teste de carga")
+    parser.add_argument('--concurrency', type=int, default=16, help="clientes simultâneos no teste de carga")
+    args = parser.parse_args()
+    
+    if args.load_test:
+        if not load_test(args.csv, args.workers, args.requests, args.concurrency):
+            print("Teste de carga falhou: respostas fora do esperado (200/304)", file=sys.stderr)
+            sys.exit(1)
+        return
+    
+    if args.serve:
+        serve(args.csv, args.host, args.port, args.workers)
+        return
+    
     root = tk.Tk()
     app = SmartBudgetApp(root)
     